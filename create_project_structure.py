@@ -8,16 +8,17 @@ structure using uv (ultrafast Python package manager) for both Windows and macOS
 It performs the following steps:
 
 1.  **OS Detection:** Identifies the current operating system (Windows, macOS, Linux).
-2.  **Project Initialization:** Uses uv to initialize a new Python project with pyproject.toml.
-3.  **Directory Structure Creation:** Creates standard project directories:
+2.  **Directory Structure Creation:** Creates standard project directories:
     *   `scripts`
     *   `src/package` (with `__init__.py`)
     *   `tests`
-4.  **Virtual Environment Setup:** Creates a uv-managed virtual environment (.venv).
-    If an environment already exists, it is removed and recreated.
-5.  **Core Dependency Installation:** Installs essential testing packages (`pytest`,
-    `pytest-html`, `pytest-mock`, `loguru`, `pathvalidate`) using uv.
-6.  **Configuration File Generation:** Creates dynamic configuration files tailored
+3.  **Project Configuration:** Writes pyproject.toml with project metadata, build
+    settings, pytest configuration and the core dependencies (`pytest`,
+    `pytest-html`, `pytest-mock`, `loguru`, `pathvalidate`).
+4.  **Environment Setup:** Runs a single `uv sync` that creates the uv-managed
+    virtual environment (.venv) and installs the core dependencies.
+    A working environment is reused and reconciled; a broken one is recreated.
+5.  **Configuration File Generation:** Creates dynamic configuration files tailored
     to the environment:
     *   `tests/conftest.py`: Provides pytest fixtures and configuration for testing.
 
@@ -55,79 +56,111 @@ Release: 1.0
 
 import os
 import platform
+import re
 import subprocess
 import sys
 import shutil
+import threading
 import logging
-import datetime
-import inspect
-import json
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
 
 # --- Attempt to import loguru, fallback to standard logging if not available ---
-try:
-    from loguru import logger
-    from project_settings import get_logger
+# loguru is installed into .venv by this script, so the import is only attempted
+# once an environment exists; on a fresh project it could never succeed
+logger = None
+if os.path.isdir(".venv"):
+    try:
+        from loguru import logger
+        from project_settings import get_logger
+
+        logger = get_logger(__name__)
+        logger.info("Using loguru for logging.")
+    except ImportError:
+        logger = None
+
+if logger is None:
+    # ANSI color codes
+    _RESET_COLOR = "\033[0m"  # Reset
+    _TIMESTAMP_COLOR = "\033[32m"  # Green for timestamp
+    _SOURCE_COLOR = "\033[36m"  # Cyan for source
+    _SUCCESS_LEVEL = 25  # Between INFO(20) and WARNING(30)
+    # Keyed by numeric level (record.levelno), which is cheaper to hash than the name
+    _LEVEL_COLORS = {
+        logging.DEBUG: "\033[36m",  # Cyan
+        logging.INFO: "\033[34m",  # Blue
+        _SUCCESS_LEVEL: "\033[32m",  # Green
+        logging.WARNING: "\033[33m",  # Yellow/Orange
+        logging.ERROR: "\033[31m",  # Red
+        logging.CRITICAL: "\033[41m\033[37m",  # White on Red background
+    }
 
-    logger = get_logger(__name__)
-    logger.info("Using loguru for logging.")
-except ImportError:
     # Custom logging setup to mimic loguru style
     class ColoredFormatter(logging.Formatter):
         """Custom formatter with colors and loguru-style formatting"""
 
-        # ANSI color codes
-        COLORS = {
-            "DEBUG": "\033[36m",  # Cyan
-            "INFO": "\033[34m",  # Blue
-            "SUCCESS": "\033[32m",  # Green
-            "WARNING": "\033[33m",  # Yellow/Orange
-            "ERROR": "\033[31m",  # Red
-            "CRITICAL": "\033[41m\033[37m",  # White on Red background
-            "RESET": "\033[0m",  # Reset
-            "TIMESTAMP": "\033[32m",  # Green for timestamp
-            "SOURCE": "\033[36m",  # Cyan for source
-        }
+        def __init__(self):
+            super().__init__(datefmt="%Y-%m-%d %H:%M:%S")
+            # Precompute the colored line template per level so each record
+            # only needs a single substitution
+            self._templates = {
+                levelno: self._build_template(levelno, logging.getLevelName(levelno))
+                for levelno in _LEVEL_COLORS
+            }
+
+        def _build_template(self, levelno, level_name):
+            """Build the colored line template for a log level.
+
+            Placeholders, in order: timestamp, module, function, line, message.
+            """
+            color = _LEVEL_COLORS.get(levelno, _RESET_COLOR)
+            level_padded = f"{level_name:<8}".replace("%", "%%")
+            return (
+                f"{_TIMESTAMP_COLOR}%s{_RESET_COLOR} | "
+                f"{color}{level_padded}{_RESET_COLOR} | "
+                f"{_SOURCE_COLOR}%s:%s:%s{_RESET_COLOR} - "
+                f"{color}%s{_RESET_COLOR}"
+            )
 
         def format(self, record):
-            # Get calling frame info
-            frame = inspect.currentframe().f_back
-            while frame:
-                if frame.f_code.co_filename != __file__:
-                    break
-                frame = frame.f_back
-
-            module_name = record.module
-            func_name = record.funcName
-            lineno = record.lineno
+            levelno = record.levelno
+            template = self._templates.get(levelno)
+            if template is None:
+                template = self._templates[levelno] = self._build_template(
+                    levelno, record.levelname
+                )
 
-            # Format timestamp
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-
-            # Get log level with consistent padding (8 chars)
-            level_name = record.levelname
-            level_padded = f"{level_name:<8}"
-
-            # Source info
-            source = f"{module_name}:{func_name}:{lineno}"
-
-            # Format the message with colors
-            color = self.COLORS.get(level_name, self.COLORS["RESET"])
-            message = record.getMessage()
+            # Format timestamp from the record's creation time
+            timestamp = f"{self.formatTime(record, self.datefmt)}.{int(record.msecs):03d}"
 
             # Construct the formatted log message
-            formatted_message = (
-                f"{self.COLORS['TIMESTAMP']}{timestamp}{self.COLORS['RESET']} | "
-                f"{color}{level_padded}{self.COLORS['RESET']} | "
-                f"{self.COLORS['SOURCE']}{source}{self.COLORS['RESET']} - "
-                f"{color}{message}{self.COLORS['RESET']}"
+            return template % (
+                timestamp,
+                record.module,
+                record.funcName,
+                record.lineno,
+                record.getMessage(),
             )
 
-            return formatted_message
+    class BufferedConsoleHandler(logging.handlers.BufferingHandler):
+        """Buffer formatted records and write them to stderr in one call"""
+
+        def shouldFlush(self, record):
+            return super().shouldFlush(record) or record.levelno >= logging.ERROR
+
+        def flush(self):
+            with self.lock:
+                if self.buffer:
+                    sys.stderr.write(
+                        "".join(f"{self.format(record)}\n" for record in self.buffer)
+                    )
+                    sys.stderr.flush()
+                    self.buffer.clear()
 
     # Set up the custom logger
     def setup_logger():
         # Add SUCCESS level between INFO and WARNING
-        logging.SUCCESS = 25  # Between INFO(20) and WARNING(30)
+        logging.SUCCESS = _SUCCESS_LEVEL
         logging.addLevelName(logging.SUCCESS, "SUCCESS")
 
         # Add success method to Logger class
@@ -142,8 +175,9 @@ except ImportError:
         logger = logging.getLogger(__name__)
         logger.setLevel(logging.DEBUG)
 
-        # Create console handler
-        console_handler = logging.StreamHandler()
+        # Create console handler that batches records into a single write;
+        # errors, explicit flush_logs() calls and interpreter exit flush it
+        console_handler = BufferedConsoleHandler(capacity=100)
         console_handler.setLevel(logging.DEBUG)
 
         # Create formatter
@@ -166,175 +200,306 @@ DYNAMIC_FILES = [
     "tests/conftest.py",
 ]
 
+# Operating system details, detected once since they cannot change mid-run
+SYSTEM = platform.system()
+IS_WINDOWS = SYSTEM == "Windows"
+VENV_PYTHON = ".venv/Scripts/python.exe" if IS_WINDOWS else ".venv/bin/python"
+VENV_ACTIVATE_COMMAND = (
+    ".venv\\Scripts\\activate" if IS_WINDOWS else "source .venv/bin/activate"
+)
+
+# Core dependencies declared in pyproject.toml and installed by `uv sync`
+CORE_DEPENDENCIES = ["pytest", "pytest-html", "pytest-mock", "loguru", "pathvalidate"]
+
+# Environment for uv subprocesses: skip progress rendering (output is discarded).
+# Values set by the user take precedence, and the cache stays at uv's shared
+# per-user default location.
+UV_ENV = {"UV_NO_PROGRESS": "1", **os.environ}
+
+# Background threads deleting old virtual environments; joined before exit
+_cleanup_threads = []
+
 # --- Helper Functions ---
 
 
+def flush_logs():
+    """Write out any buffered log records, e.g. before a long-running step."""
+    for handler in getattr(logger, "handlers", ()):
+        handler.flush()
+
+
+def remove_tree(path):
+    """Delete a directory tree, warning with the leftover path if anything remains."""
+    errors = []
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=lambda func, failed, exc: errors.append(exc))
+    else:
+        shutil.rmtree(path, onerror=lambda func, failed, info: errors.append(info[1]))
+    if errors:
+        logger.warning(
+            f"Could not fully delete '{path}' ({errors[0]}); remove it manually"
+        )
+
+
 def check_uv_installed():
     """Check if uv is installed and accessible."""
-    try:
-        result = subprocess.run(
-            ["uv", "--version"], capture_output=True, text=True, check=True
-        )
-        logger.info(f"Found uv: {result.stdout.strip()}")
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    uv_path = shutil.which("uv")
+    if uv_path is None:
         logger.error("uv is not installed or not accessible in PATH.")
         logger.error("Please install uv first:")
         logger.error("  pip install uv")
         logger.error("  or visit: https://github.com/astral-sh/uv")
         return False
+    logger.info(f"Found uv: {uv_path}")
+    return True
 
 
 def create_directory(path):
     """Create a directory if it doesn't exist."""
-    if not os.path.exists(path):
+    try:
         os.makedirs(path)
         logger.success(f"Created directory: {path}")
-    else:
+    except FileExistsError:
         logger.info(f"Directory already exists: {path}")
 
 
 def create_file(path, content):
-    """Create a file with the given content."""
-    if not os.path.exists(path):
-        with open(path, "w", encoding="utf-8") as file:
-            file.write(content)
-        logger.success(f"Created file: {path}")
-    else:
+    """Create a file with the given content (str or pre-encoded bytes)."""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    try:
+        # O_EXCL makes creation fail if the file exists, so no separate stat is needed
+        fd = os.open(
+            path,
+            os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0),
+            0o644,
+        )
+    except FileExistsError:
         logger.info(f"File already exists: {path}. Skipping creation.")
-
-
-def check_venv_exists():
-    """Check if the .venv virtual environment exists and is valid."""
-    venv_path = ".venv"
-    if not os.path.exists(venv_path):
-        return False
-
-    if platform.system() == "Windows":
-        python_exec = os.path.join(venv_path, "Scripts", "python.exe")
-    else:
-        python_exec = os.path.join(venv_path, "bin", "python")
-
-    return os.path.exists(python_exec)
-
-
-def setup_uv_project():
-    """Initialize uv project and virtual environment."""
-    # Remove existing .venv if it exists
-    if os.path.exists(".venv"):
-        logger.warning("Removing existing virtual environment '.venv'...")
-        shutil.rmtree(".venv")
-
+        return
     try:
-        # Initialize uv project (creates pyproject.toml if it doesn't exist)
-        logger.info("Initializing uv project...")
-        subprocess.run(["uv", "init", "--no-readme"], check=True, capture_output=True)
-        logger.success("UV project initialized!")
-
-        # Create virtual environment
-        logger.info("Creating virtual environment with uv...")
-        subprocess.run(["uv", "venv"], check=True, capture_output=True)
-        logger.success("Virtual environment created successfully!")
-
-        return True
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Failed to setup uv project: {e}")
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    logger.success(f"Created file: {path}")
+
+
+def _python_version_pin():
+    """Return the request in the nearest .python-version file, or None if there is none."""
+    directory = os.getcwd()
+    while True:
+        pin_path = os.path.join(directory, ".python-version")
+        try:
+            with open(pin_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        return line
+            return None
+        except OSError:
+            pass
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+def _running_python_satisfies(pin):
+    """Check whether the interpreter running this script matches a version pin."""
+    match = re.fullmatch(r"(?:cpython[@-]?)?(\d+(?:\.\d+){0,2})", pin, re.IGNORECASE)
+    if match is None:
+        # Other implementations, ranges or paths: leave the choice to uv
         return False
-
-
-def install_core_dependencies():
-    """Install core development dependencies using uv."""
-    # List all core dependencies here
-    core_deps = ["pytest", "pytest-html", "pytest-mock", "loguru", "pathvalidate"]
+    pinned = tuple(int(part) for part in match.group(1).split("."))
+    return sys.version_info[: len(pinned)] == pinned
+
+
+def setup_uv_project(missing_dependencies=()):
+    """Create or update the uv-managed virtual environment and core dependencies.
+
+    Expects pyproject.toml to already declare the project and its dependencies,
+    so a single `uv sync` creates .venv, resolves, locks and installs in one pass.
+    A working .venv is kept and reconciled by `uv sync` instead of being rebuilt.
+    Core dependencies that could not be written to pyproject.toml are passed as
+    missing_dependencies and added afterwards with `uv add`, which edits the file.
+    """
+    sync_command = ["uv", "sync"]
+    sync_env = UV_ENV
+    if os.path.exists(VENV_PYTHON):
+        logger.info("Reusing existing virtual environment '.venv'...")
+    else:
+        # Build the new .venv from this interpreter, skipping uv's interpreter
+        # discovery and download probes, unless a .python-version pin asks for a
+        # different Python; then uv selects (and if needed downloads) it as usual
+        pin = _python_version_pin()
+        if pin is None or _running_python_satisfies(pin):
+            sync_command += ["--python", sys.executable]
+            sync_env = {"UV_PYTHON_DOWNLOADS": "never", **UV_ENV}
+        # Move a broken .venv aside and delete it in the background while uv runs;
+        # the rename itself reports a missing .venv, so no existence check is needed
+        trash = f".venv.trash.{os.getpid()}"
+        try:
+            os.rename(".venv", trash)
+        except FileNotFoundError:
+            pass
+        else:
+            logger.warning("Removing broken virtual environment '.venv'...")
+            cleanup = threading.Thread(target=remove_tree, args=(trash,))
+            cleanup.start()
+            _cleanup_threads.append(cleanup)
 
     try:
-        logger.info(f"Installing core dependencies: {', '.join(core_deps)}...")
-
-        # Use uv add to install dependencies
-        for dep in core_deps:
+        logger.info(
+            f"Syncing virtual environment and core dependencies: {', '.join(CORE_DEPENDENCIES)}..."
+        )
+        flush_logs()
+        # Discard uv's progress output; stderr is kept for the error log
+        subprocess.run(
+            sync_command,
+            check=True,
+            env=sync_env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        if missing_dependencies:
+            logger.info(
+                f"Adding core dependencies: {', '.join(missing_dependencies)}..."
+            )
+            flush_logs()
             subprocess.run(
-                ["uv", "add", dep],
+                ["uv", "add", *missing_dependencies],
                 check=True,
-                capture_output=True,
+                env=UV_ENV,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
             )
-
-        logger.success(
-            f"Core dependencies installed successfully: {', '.join(core_deps)}!"
-        )
+        logger.success("Virtual environment created and core dependencies installed!")
         return True
     except subprocess.CalledProcessError as e:
-        logger.error(f"Failed to install core dependencies: {e}")
-        if hasattr(e, "stdout") and e.stdout:
-            logger.error(f"UV stdout: {e.stdout}")
-        if hasattr(e, "stderr") and e.stderr:
+        logger.error(f"Failed to setup uv project: {e}")
+        if e.stderr:
             logger.error(f"UV stderr: {e.stderr}")
         return False
 
 
-def update_pyproject_toml():
-    """Update pyproject.toml with project structure and build settings."""
-    pyproject_path = "pyproject.toml"
+def _requirement_name(requirement):
+    """Return the normalized distribution name of a PEP 508 requirement string."""
+    name = re.split(r"[\s\[<>=!~;@(]", requirement, maxsplit=1)[0]
+    return re.sub(r"[-_.]+", "-", name).lower()
 
-    # Read existing pyproject.toml if it exists
-    config = {}
-    if os.path.exists(pyproject_path):
-        try:
-            import tomli
 
-            with open(pyproject_path, "rb") as f:
-                config = tomli.load(f)
-        except ImportError:
-            # Fallback: try to read as text and update manually
-            logger.warning(
-                "tomli not available. Creating basic pyproject.toml structure."
-            )
+def merge_pyproject_toml(pyproject_path, project_name):
+    """Merge SPEC settings into an existing pyproject.toml, keeping the user's values.
 
-    # Update project configuration
-    if "project" not in config:
-        config["project"] = {}
+    Returns:
+        The core dependencies that could not be written to the file, to be added
+        with `uv add` once the environment exists.
+    """
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            tomllib = None
+    try:
+        import tomli_w
+    except ImportError:
+        tomli_w = None
 
-    project_name = os.path.basename(os.getcwd())
-    config["project"].update(
-        {
-            "name": project_name,
-            "version": "0.1.0",
-            "description": "Python project created with SPEC (Swift Python Environment Creator)",
-            "requires-python": ">=3.8",
-        }
+    if tomllib is None:
+        # Declared dependencies cannot be read, so let uv add reconcile all of them
+        logger.warning(
+            "tomli not available. Leaving existing pyproject.toml unchanged; "
+            "core dependencies will be added with uv add"
+        )
+        return list(CORE_DEPENDENCIES)
+
+    with open(pyproject_path, "rb") as f:
+        config = tomllib.load(f)
+
+    # Fill in project metadata only where the project does not define it
+    project = config.setdefault("project", {})
+    project.setdefault("name", project_name)
+    project.setdefault("version", "0.1.0")
+    project.setdefault(
+        "description",
+        "Python project created with SPEC (Swift Python Environment Creator)",
     )
+    project.setdefault("requires-python", ">=3.8")
+
+    # Add any core dependencies the project does not already declare
+    dependencies = project.setdefault("dependencies", [])
+    declared = {_requirement_name(dep) for dep in dependencies}
+    missing = [
+        dep for dep in CORE_DEPENDENCIES if _requirement_name(dep) not in declared
+    ]
+    dependencies.extend(missing)
+
+    # Only add the hatchling build settings if the project has no build system
+    tool = config.setdefault("tool", {})
+    if "build-system" not in config:
+        config["build-system"] = {
+            "requires": ["hatchling"],
+            "build-backend": "hatchling.build",
+        }
+        tool.setdefault(
+            "hatch", {"build": {"targets": {"wheel": {"packages": ["src/package"]}}}}
+        )
 
-    # Update build system
-    config["build-system"] = {
-        "requires": ["hatchling"],
-        "build-backend": "hatchling.build",
-    }
-
-    # Add tool configurations
-    if "tool" not in config:
-        config["tool"] = {}
-
-    # Add pytest configuration
-    config["tool"]["pytest"] = {
-        "ini_options": {
+    tool.setdefault("pytest", {}).setdefault(
+        "ini_options",
+        {
             "testpaths": ["tests"],
             "python_files": ["test_*.py", "*_test.py"],
             "python_classes": ["Test*"],
             "python_functions": ["test_*"],
             "addopts": "--html=reports/report.html --self-contained-html",
-        }
-    }
+        },
+    )
+
+    if tomli_w is None:
+        if missing:
+            logger.warning(
+                "tomli-w not available. Leaving existing pyproject.toml unchanged; "
+                f"missing dependencies will be added with uv add: {', '.join(missing)}"
+            )
+        else:
+            logger.info("Existing pyproject.toml already declares the core dependencies")
+        return missing
+
+    with open(pyproject_path, "wb") as f:
+        tomli_w.dump(config, f)
+    logger.success("Updated existing pyproject.toml with project configuration")
+    return []
+
+
+def update_pyproject_toml():
+    """Write pyproject.toml with project structure, dependencies and build settings.
+
+    Returns:
+        The core dependencies still missing from pyproject.toml (see
+        merge_pyproject_toml); empty when the file declares all of them.
+    """
+    pyproject_path = "pyproject.toml"
+    project_name = os.path.basename(os.getcwd())
 
-    # Write updated pyproject.toml
+    # Merge into an existing, non-empty pyproject.toml instead of overwriting it;
+    # a fresh project gets the template below without any TOML parsing
     try:
-        import tomli_w
+        has_existing = os.path.getsize(pyproject_path) > 0
+    except OSError:
+        has_existing = False
+    if has_existing:
+        return merge_pyproject_toml(pyproject_path, project_name)
 
-        with open(pyproject_path, "wb") as f:
-            tomli_w.dump(config, f)
-        logger.success("Updated pyproject.toml with project configuration")
-    except ImportError:
-        # Fallback: create basic pyproject.toml manually
-        basic_pyproject = f"""[build-system]
+    dependencies = ", ".join(f'"{dep}"' for dep in CORE_DEPENDENCIES)
+
+    pyproject_content = f"""[build-system]
 requires = ["hatchling"]
 build-backend = "hatchling.build"
 
@@ -343,6 +508,10 @@ name = "{project_name}"
 version = "0.1.0"
 description = "Python project created with SPEC (Swift Python Environment Creator)"
 requires-python = ">=3.8"
+dependencies = [{dependencies}]
+
+[tool.hatch.build.targets.wheel]
+packages = ["src/package"]
 
 [tool.pytest.ini_options]
 testpaths = ["tests"]
@@ -351,15 +520,15 @@ python_classes = ["Test*"]
 python_functions = ["test_*"]
 addopts = "--html=reports/report.html --self-contained-html"
 """
-        with open(pyproject_path, "w", encoding="utf-8") as f:
-            f.write(basic_pyproject)
-        logger.success("Created basic pyproject.toml")
-
+    with open(pyproject_path, "w", encoding="utf-8") as f:
+        f.write(pyproject_content)
+    logger.success("Wrote pyproject.toml with project configuration")
+    return []
 
-def create_conftest():
-    """Create the tests/conftest.py file with basic pytest fixtures and configuration."""
 
-    conftest_content = '''# tests/conftest.py
+# --- Static File Contents ---
+# Pre-encoded once at import so writing them needs no per-call text encoding
+CONFTEST_CONTENT = b'''# tests/conftest.py
 """
 Pytest configuration file for shared fixtures and test settings.
 All test files in this directory and subdirectories can use these fixtures.
@@ -420,58 +589,57 @@ def sample_data():
 #     }
 '''
 
-    create_file(os.path.join("tests", "conftest.py"), conftest_content)
+
+def create_conftest():
+    """Create the tests/conftest.py file with basic pytest fixtures and configuration."""
+    create_file("tests/conftest.py", CONFTEST_CONTENT)
 
 
 # Main function
 def main():
-    # Check if uv is installed
-    if not check_uv_installed():
-        sys.exit(1)
-
-    # Detect the operating system
-    system = platform.system()
-    logger.info(f"Setting up Python project for {system} using SPEC and uv")
+    logger.info(f"Setting up Python project for {SYSTEM} using SPEC and uv")
 
     # Determine project root
     project_root = os.getcwd()  # Current working directory
 
-    # Create the project structure directories
-    create_directory("scripts")
-    create_directory("src/package")
-    create_directory("tests")
-    create_directory("reports")  # For test reports
-
-    # Create __init__.py in package
-    create_file("src/package/__init__.py", "")
-
-    # Initialize uv project and virtual environment
-    if not setup_uv_project():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # Check if uv is installed in the background while the structure is created
+        uv_check = executor.submit(check_uv_installed)
+
+        # Create the project structure directories concurrently ("reports" holds
+        # test reports)
+        directories = ["scripts", "src/package", "tests", "reports"]
+        for _ in executor.map(create_directory, directories):
+            pass
+        init_future = executor.submit(create_file, "src/package/__init__.py", "")
+
+        # Stop before touching pyproject.toml (which a merge may rewrite) if uv
+        # is missing
+        if not uv_check.result():
+            init_future.result()
+            sys.exit(1)
+
+        # Write pyproject.toml (with core dependencies) and the dynamic files
+        # concurrently; they are independent of each other
+        pyproject_future = executor.submit(update_pyproject_toml)
+        futures = [init_future, pyproject_future, executor.submit(create_conftest)]
+        for future in futures:
+            future.result()
+        missing_dependencies = pyproject_future.result()
+
+    # Create the virtual environment and install core dependencies
+    if not setup_uv_project(missing_dependencies):
         logger.critical("Failed to set up uv project")
         sys.exit(1)
 
-    # Install core dependencies
-    if not install_core_dependencies():
-        logger.critical("Failed to install core dependencies.")
-        sys.exit(1)
-
-    # Update pyproject.toml with project configuration
-    update_pyproject_toml()
-
-    # Create dynamic files
-    create_conftest()
-
     # Display helpful messages on what to do next
     logger.success("SPEC project setup complete!")
 
     logger.info(
-        f"Your project is using uv with a .venv virtual environment on {system}."
+        f"Your project is using uv with a .venv virtual environment on {SYSTEM}."
     )
     logger.info("To activate the virtual environment:")
-    if system == "Windows":
-        logger.info("  .venv\\Scripts\\activate")
-    else:
-        logger.info("  source .venv/bin/activate")
+    logger.info(f"  {VENV_ACTIVATE_COMMAND}")
 
     logger.info("To add new dependencies:")
     logger.info("  uv add <package-name>")
@@ -495,6 +663,10 @@ def main():
     logger.info("  - tests/conftest.py: Pytest configuration and shared fixtures")
     logger.info("  - reports/: Test report output directory")
 
+    # Wait for any old virtual environment to finish being deleted
+    for cleanup in _cleanup_threads:
+        cleanup.join()
+
 
 if __name__ == "__main__":
     # Add a debug message to demonstrate all log levels
@@ -20,94 +20,164 @@ Release: 1.0
 """
 import os
 import sys
+import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from loguru import logger
 from pathvalidate import sanitize_filepath, sanitize_filename
 
+# Prefer the stdlib TOML parser (Python 3.11+); fall back to tomli if installed
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
 # --- Project Root and Path Setup ---
 PROJECT_ROOT = Path(__file__).parent.absolute()
 sys.path.insert(0, str(PROJECT_ROOT))
 
 # --- UV Configuration ---
+def _default_uv_cache_dir() -> Path:
+    """Return uv's shared per-user cache directory (honouring UV_CACHE_DIR).
+
+    Keeping the cache outside the project lets every SPEC project reuse downloaded
+    wheels and hardlink them into its .venv instead of downloading them again.
+    """
+    if os.getenv("UV_CACHE_DIR"):
+        return Path(os.environ["UV_CACHE_DIR"])
+    if os.name == "nt":  # Windows
+        local_app_data = os.getenv("LOCALAPPDATA", Path.home() / "AppData" / "Local")
+        return Path(local_app_data) / "uv" / "cache"
+    return Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "uv"
+
+
 UV_CONFIG = {
     "venv_path": PROJECT_ROOT / ".venv",
     "pyproject_path": PROJECT_ROOT / "pyproject.toml",
     "lock_file_path": PROJECT_ROOT / "uv.lock",
-    "cache_dir": PROJECT_ROOT / ".uv-cache",
+    "cache_dir": _default_uv_cache_dir(),
 }
 
 # --- Loguru Logger Configuration ---
 # Default settings (can be overridden)
 DEFAULT_LOG_FILE_NAME = "spec_project.log"
 DEFAULT_TEST_FILE_NAME = "spec_project_file"
-LOG_DIR = PROJECT_ROOT / "logs"  # Define a log directory
-
-# Ensure the log directory exists
-LOG_DIR.mkdir(exist_ok=True)
+LOG_DIR = PROJECT_ROOT / "logs"  # Define a log directory (created on first use)
+
+
+# Log line formats shared by every module logger; {extra[module]} is the module name
+# passed to get_logger()
+FILE_LOG_FORMAT = (
+    "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {extra[module]} | {message}"
+)
+CONSOLE_LOG_FORMAT = (
+    "<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | "
+    "<cyan>{extra[module]}</cyan> | <level>{message}</level>"
+)
+
+# Sinks are attached once and then shared by all module loggers
+_sinks_configured = False
+_suffix_sink_paths = set()
+
+
+def _configure_sinks(enqueue: bool) -> None:
+    """Attach the shared log file and console sinks to loguru on first use."""
+    global _sinks_configured
+    if _sinks_configured:
+        return
+
+    LOG_DIR.mkdir(exist_ok=True)
+    logger.configure(
+        handlers=[
+            {
+                "sink": str(LOG_DIR / DEFAULT_LOG_FILE_NAME),
+                "format": FILE_LOG_FORMAT,
+                "level": "DEBUG",
+                "rotation": "10 MB",
+                "enqueue": enqueue,
+            },
+            # Console handler (optional, but useful for development)
+            {
+                "sink": sys.stderr,
+                "format": CONSOLE_LOG_FORMAT,
+                "level": "INFO",
+                "enqueue": enqueue,
+            },
+        ],
+        # Defaults for records logged without get_logger(), e.g. this module's helpers
+        extra={"module": "project_settings", "test_file": DEFAULT_TEST_FILE_NAME},
+    )
+    _sinks_configured = True
 
 
 def get_logger(
     module_name: str,
     log_file_name_suffix: str = None,
     test_file_name: str = DEFAULT_TEST_FILE_NAME,
+    enqueue: bool = False,
 ) -> logger:
-    """Creates and configures a Loguru logger for a specific module in a SPEC project.
+    """Returns a Loguru logger for a specific module in a SPEC project.
+
+    All module loggers share one log file (``logs/spec_project.log``) and one
+    console sink, which are attached on the first call; each record is tagged
+    with its module name.
 
     Args:
-        module_name: The name of the module (used for the logger name and log file).
-        log_file_name_suffix: Optional suffix for the log file name.
-        test_file_name: The name of the test file for filtering.
+        module_name: The name of the module (shown in every log line).
+        log_file_name_suffix: Optional suffix; if given, this module's records are
+            additionally written to ``logs/<module_name>_<suffix>.log``.
+        test_file_name: The name of the test file, bound into each record's extra.
+        enqueue: Route records through a background queue (useful for multiprocess
+            logging; adds a worker thread per sink, so off by default for short-lived
+            scripts). Only applies to sinks created by this call.
 
     Returns:
         A configured Loguru logger object.
     """
-    # Create a named logger
-    module_logger = logger.bind(name=module_name)
-
-    # Remove any existing handlers from the module logger (if any)
-    module_logger.remove()
+    _configure_sinks(enqueue)
+    module_logger = logger.bind(module=module_name, test_file=test_file_name)
 
-    # Construct the log file name
     if log_file_name_suffix:
-        log_file_name = LOG_DIR / f"{module_name}_{log_file_name_suffix}.log"
-    else:
-        log_file_name = LOG_DIR / f"{module_name}.log"
-
-    # Add a file handler for this module
-    module_logger.add(
-        str(log_file_name),
-        format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name} | {message}",
-        level="DEBUG",
-        rotation="10 MB",
-        enqueue=True,
-        filter=lambda record: record["extra"].get("test_file") == test_file_name,
-    )
+        log_file_name = str(LOG_DIR / f"{module_name}_{log_file_name_suffix}.log")
+        if log_file_name not in _suffix_sink_paths:
+            logger.add(
+                log_file_name,
+                format=FILE_LOG_FORMAT,
+                level="DEBUG",
+                rotation="10 MB",
+                enqueue=enqueue,
+                filter=lambda record: record["extra"].get("log_file") == log_file_name,
+            )
+            _suffix_sink_paths.add(log_file_name)
+        module_logger = module_logger.bind(log_file=log_file_name)
 
-    # Add a console handler (optional, but useful for development)
-    module_logger.add(
-        sys.stderr,
-        format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan> | <level>{message}</level>",
-        level="INFO",
-        enqueue=True,
-        filter=lambda record: record["extra"].get("test_file") == test_file_name,
-    )
+    return module_logger
 
-    # Add the test_file filter to the logger
-    module_logger = module_logger.bind(test_file=test_file_name)
 
-    return module_logger
+def init_logging() -> logger:
+    """Set up the project-level logger and announce the loaded configuration.
+
+    Importing this module has no logging or filesystem side effects; entry points
+    that want the project-wide log call this once.
+
+    Returns:
+        The configured project-level Loguru logger.
+    """
+    project_logger = get_logger("project_settings")
+    project_logger.info(f"SPEC project configuration loaded from {PROJECT_ROOT}")
+    project_logger.debug(f"Environment: {get_environment()}")
+    return project_logger
 
 
 # --- UV Helper Functions ---
 
 def check_uv_installation() -> bool:
     """Check if uv is installed and accessible."""
-    try:
-        result = subprocess.run(["uv", "--version"], capture_output=True, text=True, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    return shutil.which("uv") is not None
 
 
 def get_uv_python_path() -> Path:
@@ -133,33 +203,65 @@ def is_uv_project() -> bool:
     return UV_CONFIG["pyproject_path"].exists()
 
 
-def get_project_dependencies():
-    """Get project dependencies from pyproject.toml."""
+@lru_cache(maxsize=8)
+def _load_pyproject(pyproject_path: Path, mtime_ns: int) -> dict:
+    """Parse a pyproject.toml file; cached per (path, modification time)."""
+    with open(pyproject_path, "rb") as f:
+        return tomllib.load(f)
+
+
+def _pyproject_mtime_ns():
+    """Return pyproject.toml's modification time in ns, or None if it does not exist."""
+    try:
+        return UV_CONFIG["pyproject_path"].stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _parse_pyproject(mtime_ns: int = None) -> dict:
+    """Parse the project's pyproject.toml, reusing the result while it is unchanged.
+
+    Args:
+        mtime_ns: The file's modification time if the caller has already stat'ed it.
+
+    Returns an empty dict if the file is missing or cannot be parsed. The returned
+    dict is shared between callers and must not be modified.
+    """
     pyproject_path = UV_CONFIG["pyproject_path"]
-    if not pyproject_path.exists():
+    if mtime_ns is None:
+        mtime_ns = _pyproject_mtime_ns()
+        if mtime_ns is None:
+            return {}
+
+    if tomllib is None:
+        logger.warning("tomllib/tomli not available. Cannot parse pyproject.toml")
         return {}
-    
+
     try:
-        import tomli
-        with open(pyproject_path, "rb") as f:
-            data = tomli.load(f)
-        
-        dependencies = {}
-        if "project" in data and "dependencies" in data["project"]:
-            dependencies["main"] = data["project"]["dependencies"]
-        
-        if "project" in data and "optional-dependencies" in data["project"]:
-            dependencies["optional"] = data["project"]["optional-dependencies"]
-            
-        return dependencies
-    except ImportError:
-        logger.warning("tomli not available. Cannot parse pyproject.toml")
-        return {}
+        return _load_pyproject(pyproject_path, mtime_ns)
     except Exception as e:
         logger.error(f"Error reading pyproject.toml: {e}")
         return {}
 
 
+def _extract_dependencies(data: dict) -> dict:
+    """Extract main and optional dependencies from parsed pyproject.toml data."""
+    project = data.get("project", {})
+    dependencies = {}
+    if "dependencies" in project:
+        dependencies["main"] = list(project["dependencies"])
+
+    if "optional-dependencies" in project:
+        dependencies["optional"] = dict(project["optional-dependencies"])
+
+    return dependencies
+
+
+def get_project_dependencies():
+    """Get project dependencies from pyproject.toml."""
+    return _extract_dependencies(_parse_pyproject())
+
+
 def sync_uv_environment():
     """Sync the uv environment with pyproject.toml."""
     try:
@@ -237,31 +339,27 @@ DIST_FORMAT = "wheel"  # or "sdist"
 # - Useful for build scripts and project introspection.
 def get_project_info() -> dict:
     """Get comprehensive project information from pyproject.toml and uv environment."""
+    # Stat each path once, and parse pyproject.toml once for dependencies and metadata
+    venv_exists = UV_CONFIG["venv_path"].exists()
+    pyproject_mtime_ns = _pyproject_mtime_ns()
+    data = _parse_pyproject(pyproject_mtime_ns) if pyproject_mtime_ns is not None else {}
     info = {
         "project_root": str(PROJECT_ROOT),
         "has_uv": check_uv_installation(),
-        "is_uv_project": is_uv_project(),
-        "venv_exists": UV_CONFIG["venv_path"].exists(),
-        "python_path": str(get_uv_python_path()) if UV_CONFIG["venv_path"].exists() else None,
-        "dependencies": get_project_dependencies(),
+        "is_uv_project": pyproject_mtime_ns is not None,
+        "venv_exists": venv_exists,
+        "python_path": str(get_uv_python_path()) if venv_exists else None,
+        "dependencies": _extract_dependencies(data),
     }
     
     # Add pyproject.toml metadata if available
-    try:
-        import tomli
-        pyproject_path = UV_CONFIG["pyproject_path"]
-        if pyproject_path.exists():
-            with open(pyproject_path, "rb") as f:
-                data = tomli.load(f)
-            if "project" in data:
-                info.update({
-                    "name": data["project"].get("name", "unknown"),
-                    "version": data["project"].get("version", "0.0.0"),
-                    "description": data["project"].get("description", ""),
-                    "python_requires": data["project"].get("requires-python", ">=3.8"),
-                })
-    except Exception as e:
-        logger.debug(f"Could not read project metadata: {e}")
+    if "project" in data:
+        info.update({
+            "name": data["project"].get("name", "unknown"),
+            "version": data["project"].get("version", "0.0.0"),
+            "description": data["project"].get("description", ""),
+            "python_requires": data["project"].get("requires-python", ">=3.8"),
+        })
     
     return info
 
@@ -299,8 +397,3 @@ def get_environment() -> str:
     else:
         return "production"
 
-
-# Initialize project-level logger
-project_logger = get_logger("project_settings")
-project_logger.info(f"SPEC project configuration loaded from {PROJECT_ROOT}")
-project_logger.debug(f"Environment: {get_environment()}")
\ No newline at end of file
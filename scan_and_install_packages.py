@@ -11,15 +11,18 @@ It performs the following steps:
 2.  **Source Code Scanning:** It scans all Python (`.py`) files within the `src/package` and `scripts`
     directories for `import` statements. It then extracts the top-level module names from these imports.
 3.  **Dependency Installation:** For each identified module, it checks if it's already installed in the
-    current Python environment. If not, it attempts to install the corresponding package using `uv add`.
+    current Python environment. Missing packages are installed together with one `uv add` call
+    (retrying one at a time if the batch fails).
     A mapping is used to handle cases where the import name differs from the PyPI package name.
-4.  **Lock File Update:** Finally, it ensures the `uv.lock` file is up to date by running `uv sync`.
+4.  **Lock File Update:** Missing packages are added with a single `uv add`, which also
+    updates the `uv.lock` file.
 
 **Key Features:**
 
 *   **UV-Based:** Uses uv for ultra-fast dependency resolution and installation.
 *   **pyproject.toml Support:** Reads from and updates modern Python project configuration.
 *   **Automatic Dependency Detection:** Scans source code to identify required modules.
+*   **Incremental Scans:** Caches each file's imports in `.spec_import_cache.json` so unchanged files are not re-parsed.
 *   **Handles Import/Package Name Differences:** Uses a mapping to resolve common discrepancies.
 *   **Lock File Management:** Maintains uv.lock for reproducible builds.
 *   **Robust Project Root Detection:** Attempts to find the project root even if the script is not run from there.
@@ -50,22 +53,45 @@ Release: 1.0
 """
 
 import os
+import re
+import mmap
 import ast
+from ast import Import as _AST_Import, ImportFrom as _AST_ImportFrom
 import sys
+import shutil
 import subprocess
-import importlib.util
+import importlib.machinery
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import logging
-import datetime
-import inspect
+import time
 import json
+import itertools
+from collections import deque
+from functools import lru_cache
+from multiprocessing import parent_process
+
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+# Parse workers started with spawn or forkserver re-import this module (as __mp_main__
+# when it is run as a script); they must not reconfigure the shared log file sinks or
+# repeat the startup banner
+IS_MAIN_PROCESS = __name__ != "__mp_main__" and parent_process() is None
 
 # --- Attempt to import loguru, fallback to standard logging if not available ---
 try:
     from loguru import logger
-    from project_settings import get_logger
 
-    logger = get_logger(__name__)
-    logger.info("Using loguru for logging.")
+    if IS_MAIN_PROCESS:
+        from project_settings import get_logger
+
+        logger = get_logger(__name__)
+        logger.info("Using loguru for logging.")
 except ImportError:
     # Custom logging setup to mimic loguru style
     class ColoredFormatter(logging.Formatter):
@@ -84,20 +110,24 @@ except ImportError:
             "SOURCE": "\033[36m",  # Cyan for source
         }
 
-        def format(self, record):
-            # Get calling frame info
-            frame = inspect.currentframe().f_back
-            while frame:
-                if frame.f_code.co_filename != __file__:
-                    break
-                frame = frame.f_back
+        def __init__(self):
+            super().__init__()
+            # Timestamp text up to the second, reused for records within that second
+            self._cached_sec = -1
+            self._cached_prefix = ""
 
+        def format(self, record):
+            # The logging module already records the caller's location
             module_name = record.module
             func_name = record.funcName
             lineno = record.lineno
 
             # Format timestamp
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+            sec = int(record.created)
+            if sec != self._cached_sec:
+                self._cached_sec = sec
+                self._cached_prefix = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+            timestamp = f"{self._cached_prefix}.{int(record.msecs):03d}"
 
             # Get log level with consistent padding (8 chars)
             level_name = record.levelname
@@ -153,93 +183,330 @@ except ImportError:
 
     # Initialize logger
     logger = setup_logger()
-    logger.warning("loguru not found. Using standard logging as fallback.")
+    if IS_MAIN_PROCESS:
+        logger.warning("loguru not found. Using standard logging as fallback.")
 
 
 def check_uv_installed():
     """Check if uv is installed and accessible."""
-    try:
-        result = subprocess.run(["uv", "--version"], capture_output=True, text=True, check=True)
-        logger.info(f"Found uv: {result.stdout.strip()}")
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    uv_path = shutil.which("uv")
+    if uv_path is None:
         logger.error("uv is not installed or not accessible in PATH.")
         logger.error("Please install uv first:")
         logger.error("  pip install uv")
         logger.error("  or visit: https://github.com/astral-sh/uv")
         return False
+    logger.info(f"Found uv: {uv_path}")
+    return True
 
 
 def sync_dependencies(pyproject_file):
-    """Sync dependencies from pyproject.toml using uv sync."""
+    """Sync dependencies from pyproject.toml using uv sync. Returns True if the sync succeeded."""
     if os.path.isfile(pyproject_file):
         logger.info(f"Found pyproject.toml at {pyproject_file}. Syncing dependencies...")
         try:
-            subprocess.check_call(["uv", "sync"])
+            subprocess.check_call(["uv", "sync"], stdout=subprocess.DEVNULL)
             logger.success("Successfully synced dependencies from pyproject.toml")
+            return True
         except subprocess.CalledProcessError as e:
             logger.error(f"Error syncing from pyproject.toml: {e}")
     else:
         logger.info("No pyproject.toml file found. Will scan source files for imports.")
+    return False
+
+
+# Lines that start a top-level import (after an optional UTF-8 BOM on line 1), lines
+# that start any new top-level statement, and top-level lines with "; import" in them
+_IMPORT_LINE_RE = re.compile(rb"^(?:\xef\xbb\xbf)?(?:import|from)[ \t\\(]", re.MULTILINE)
+_STATEMENT_START_RE = re.compile(rb"^[^\s#)\]}]", re.MULTILINE)
+_SEMICOLON_IMPORT_RE = re.compile(
+    rb"^[^\s#][^\n]*;[ \t]*(?:import|from)[ \t\\(]", re.MULTILINE
+)
+
+
+def import_prefix(source):
+    """Return source cut just before the first top-level statement after its last import.
+
+    Top-level imports start a line, so they fall inside the prefix. The exception is
+    an import after a semicolon ("x = 1; import y"): if a line like that may follow
+    the cut, the full source is returned. If the cut lands inside a string or bracket
+    the prefix fails to parse, and callers should fall back to the full source.
+    source may be bytes or an mmap; bytes are returned.
+    """
+    last_import = None
+    for last_import in _IMPORT_LINE_RE.finditer(source):
+        pass
+    if last_import is None:
+        cut = 0
+    else:
+        next_statement = _STATEMENT_START_RE.search(source, last_import.end())
+        if next_statement is None:
+            return source[:]
+        cut = next_statement.start()
+    if _SEMICOLON_IMPORT_RE.search(source, cut):
+        return source[:]
+    return source[:cut]
+
+
+# Files larger than this are memory-mapped, so only their import prefix gets copied
+MMAP_THRESHOLD = 64 * 1024
 
 
 def get_top_level_imports(file_path):
-    """Parse a Python source file and extract a set of top-level module names from import statements."""
+    """Parse a Python source file and extract a set of top-level module names from import statements.
+
+    Returns None if the file could not be read or parsed, so the result is not cached
+    and the problem is reported again on the next scan.
+    """
+    imports, problem = read_top_level_imports(file_path)
+    if problem is not None:
+        log_problem(problem)
+    return imports
+
+
+def log_problem(problem):
+    """Log a (level, message) pair reported by read_top_level_imports."""
+    level, message = problem
+    getattr(logger, level)(message)
+
+
+def read_top_level_imports(file_path):
+    """Extract a file's top-level imports without logging, so worker processes can run it.
+
+    Returns:
+        An (imports, problem) tuple. If the file cannot be read or parsed, imports is
+        None and problem is a (level, message) pair for the caller to log.
+    """
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
+        # Raw bytes: ast.parse decodes them itself, honoring any PEP 263 coding cookie
+        with open(file_path, "rb", buffering=0) as file:
+            if os.fstat(file.fileno()).st_size > MMAP_THRESHOLD:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                    return parse_top_level_imports(source, file_path)
             file_content = file.read()
     except Exception as e:
-        logger.error(f"Error reading {file_path}: {e}")
-        return set()
+        return None, ("error", f"Error reading {file_path}: {e}")
+    return parse_top_level_imports(file_content, file_path)
+
+
+def parse_top_level_imports(source, file_path):
+    """Extract top-level module names from source bytes or a memory-mapped file.
+
+    Returns:
+        An (imports, problem) tuple, as for read_top_level_imports.
+    """
+    # A file without the keyword has no import statements, so skip building its AST
+    if source.find(b"import") == -1:
+        return set(), None
 
     try:
-        tree = ast.parse(file_content, filename=file_path)
-    except SyntaxError as e:
-        logger.warning(f"Skipping {file_path} due to SyntaxError: {e}")
-        return set()
+        try:
+            # Only the statements up to the last import need an AST
+            tree = ast.parse(import_prefix(source), filename=file_path)
+        except SyntaxError:
+            # The cut was ambiguous (inside a string or bracket): parse everything
+            tree = ast.parse(source[:], filename=file_path)
+    except (SyntaxError, ValueError) as e:
+        # ValueError covers source containing null bytes on older Pythons
+        return None, ("warning", f"Skipping {file_path} due to {type(e).__name__}: {e}")
 
     imports = set()
-    for node in ast.iter_child_nodes(tree):
+    for node in tree.body:
         # Handle "import foo, bar" statements.
-        if isinstance(node, ast.Import):
+        if isinstance(node, _AST_Import):
             for alias in node.names:
-                mod_name = alias.name.split(".")[0]
+                mod_name = alias.name.partition(".")[0]
                 imports.add(mod_name)
         # Handle "from foo import bar" statements.
-        elif isinstance(node, ast.ImportFrom):
+        elif isinstance(node, _AST_ImportFrom):
             # Skip relative imports (e.g. "from .module import something")
             if node.level == 0 and node.module:
-                mod_name = node.module.split(".")[0]
+                mod_name = node.module.partition(".")[0]
                 imports.add(mod_name)
-    return imports
+    return imports, None
 
 
-def find_all_imports(src_dirs):
-    """Walk through the src_dirs recursively, parse all .py files, and collect all top-level imports."""
-    all_imports = set()
-    python_files_found = 0
+# Below this many files, parsing serially is faster than starting worker processes
+PARALLEL_PARSE_THRESHOLD = 8
+# Files handed to a worker process per task
+PARSE_BATCH_SIZE = 16
+
+
+def _parse_batch(file_paths):
+    """Parse a batch of files in a worker process.
+
+    Workers never log: problems are returned with the results and logged by the
+    parent, so they reach the same sinks (including the log file) as serial parsing.
+    """
+    return [(file_path, *read_top_level_imports(file_path)) for file_path in file_paths]
+
+
+def _report_batch(results):
+    """Log the problems in a worker's batch results and yield (file_path, imports)."""
+    for file_path, imports, problem in results:
+        if problem is not None:
+            log_problem(problem)
+        yield file_path, imports
+
 
+def parse_files(py_files):
+    """Yield (file_path, imports) for each file, parsing in a process pool when worthwhile.
+
+    py_files may be any iterable; it is consumed lazily, so discovering files overlaps
+    with parsing the ones already found.
+    """
+    py_files = iter(py_files)
+    head = list(itertools.islice(py_files, PARALLEL_PARSE_THRESHOLD))
+    if len(head) < PARALLEL_PARSE_THRESHOLD:
+        for file_path in head:
+            yield file_path, get_top_level_imports(file_path)
+        return
+
+    # ast.parse is CPU-bound and holds the GIL, so use processes rather than threads.
+    # Keep only a few batches in flight so memory stays bounded on huge trees.
+    remaining = itertools.chain(head, py_files)
+    batches = iter(lambda: list(itertools.islice(remaining, PARSE_BATCH_SIZE)), [])
+    first_batch = next(batches)
+    executor = None
+    try:
+        executor = ProcessPoolExecutor()
+        pending = deque([executor.submit(_parse_batch, first_batch)])
+    except (OSError, NotImplementedError) as e:
+        # No usable multiprocessing support (e.g. no sem_open, process limits)
+        logger.warning(f"Could not start worker processes ({e}). Parsing serially.")
+        if executor is not None:
+            executor.shutdown(wait=False)
+        for file_path in itertools.chain(first_batch, remaining):
+            yield file_path, get_top_level_imports(file_path)
+        return
+
+    max_pending = (os.cpu_count() or 1) * 2
+    with executor:
+        for batch in batches:
+            if len(pending) >= max_pending:
+                yield from _report_batch(pending.popleft().result())
+            pending.append(executor.submit(_parse_batch, batch))
+        while pending:
+            yield from _report_batch(pending.popleft().result())
+
+
+# Directories that never contain project sources worth scanning
+SKIP_DIRS = frozenset({".git", "__pycache__", ".venv", "node_modules"})
+
+
+def iter_py_files(root):
+    """Recursively yield paths of .py files under root, skipping SKIP_DIRS."""
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                # is_dir() and name come from the directory listing, so no extra stat
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        yield from iter_py_files(entry.path)
+                elif entry.name.endswith(".py"):
+                    yield entry.path
+    except OSError as e:
+        logger.warning(f"Cannot scan {root}: {e}")
+
+
+# Per-file import results from previous runs, stored in the project root
+IMPORT_CACHE_FILE = ".spec_import_cache.json"
+# Bump whenever import extraction changes, so entries from older logic are discarded
+IMPORT_CACHE_VERSION = 3
+
+
+def load_import_cache():
+    """Load the cached imports, ignoring caches from another Python or cache version."""
+    try:
+        with open(IMPORT_CACHE_FILE, "r", encoding="utf-8") as file:
+            cache = json.load(file)
+        if cache.get("version") != IMPORT_CACHE_VERSION:
+            logger.info("Import cache was built by an older version of this script. Rescanning.")
+            return {}
+        if cache["python"] != list(sys.version_info[:2]):
+            logger.info("Import cache was built by another Python version. Rescanning.")
+            return {}
+        return cache["files"]
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable import cache {IMPORT_CACHE_FILE}: {e}")
+        return {}
+
+
+def save_import_cache(files):
+    """Write the per-file imports so unchanged files are not parsed on the next run."""
+    try:
+        with open(IMPORT_CACHE_FILE, "w", encoding="utf-8") as file:
+            header = {"version": IMPORT_CACHE_VERSION, "python": list(sys.version_info[:2])}
+            json.dump({**header, "files": files}, file)
+    except OSError as e:
+        logger.warning(f"Could not write import cache {IMPORT_CACHE_FILE}: {e}")
+
+
+def iter_source_files(src_dirs):
+    """Yield the .py files under each of src_dirs, logging how many each one holds."""
     for src_dir in src_dirs:
         if not os.path.exists(src_dir):
             logger.warning(f"Directory {src_dir} does not exist. Skipping.")
             continue
-            
+
         logger.info(f"Scanning directory: {src_dir}")
-        for root, dirs, files in os.walk(src_dir):
-            python_files = [f for f in files if f.endswith(".py")]
-            if python_files:
-                logger.info(f"Found {len(python_files)} Python files in {root}")
-                python_files_found += len(python_files)
-
-            for file in files:
-                if file.endswith(".py"):
-                    file_path = os.path.join(root, file)
-                    logger.debug(f"Processing: {file_path}")
-                    file_imports = get_top_level_imports(file_path)
-                    if file_imports:
-                        logger.debug(f"  - Found imports: {file_imports}")
-                    all_imports.update(file_imports)
+        dir_file_count = 0
+        for file_path in iter_py_files(src_dir):
+            dir_file_count += 1
+            yield file_path
+        logger.info(f"Found {dir_file_count} Python files in {src_dir}")
 
+
+def find_all_imports(src_dirs):
+    """Walk through the src_dirs recursively, parse all .py files, and collect all top-level imports."""
+    all_imports = set()
+    cache = load_import_cache()
+    new_cache = {}
+    stale_keys = {}
+    python_files_found = 0
+    files_reused = 0
+
+    def iter_stale_files():
+        """Stream discovered files to the parser, answering unchanged ones from the cache."""
+        nonlocal python_files_found, files_reused
+        for file_path in iter_source_files(src_dirs):
+            python_files_found += 1
+            try:
+                st = os.stat(file_path)
+            except OSError as e:
+                # Dangling symlinks and files deleted mid-scan
+                logger.error(f"Error reading {file_path}: {e}")
+                continue
+            file_key = [st.st_mtime_ns, st.st_size]
+            entry = cache.get(file_path)
+            if entry and entry[:2] == file_key:
+                cached_imports = [sys.intern(name) for name in entry[2]]
+                all_imports.update(cached_imports)
+                new_cache[file_path] = [*file_key, cached_imports]
+                files_reused += 1
+            else:
+                stale_keys[file_path] = file_key
+                yield file_path
+
+    for file_path, file_imports in parse_files(iter_stale_files()):
+        file_key = stale_keys.pop(file_path)
+        if file_imports is None:
+            # Unreadable or unparseable files are retried (and reported) on the next
+            # run rather than cached as having no imports
+            continue
+        # Names arrive unpickled from worker processes, so intern them here: every file
+        # importing a module then shares one string object. One debug record per
+        # file, reusing the sorted list the cache needs anyway.
+        sorted_imports = sorted(sys.intern(name) for name in file_imports)
+        logger.debug(f"Processed {file_path}: {sorted_imports or 'no imports'}")
+        all_imports.update(sorted_imports)
+        new_cache[file_path] = [*file_key, sorted_imports]
+
+    save_import_cache(new_cache)
+
+    logger.info(f"Reused cached imports for {files_reused} unchanged files")
     logger.info(f"Total Python files processed: {python_files_found}")
     if python_files_found == 0:
         logger.warning("WARNING: No Python files were found to process!")
@@ -247,9 +514,35 @@ def find_all_imports(src_dirs):
     return all_imports
 
 
-def is_installed(module_name):
-    """Check whether a module is installed using importlib.util.find_spec."""
-    return importlib.util.find_spec(module_name) is not None
+def get_installed_modules():
+    """Collect every top-level module name importable from sys.path in a single pass."""
+    installed = set(sys.builtin_module_names)
+    module_suffixes = tuple(importlib.machinery.all_suffixes())
+
+    for path_entry in sys.path:
+        try:
+            entries = os.scandir(path_entry or ".")
+        except OSError:
+            # Zip archives and missing directories have nothing to list
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith((".dist-info", ".egg-info")):
+                    # top_level.txt records import names that differ from the dist name
+                    top_level = os.path.join(entry.path, "top_level.txt")
+                    try:
+                        with open(top_level, "r", encoding="utf-8") as file:
+                            installed.update(line.strip() for line in file if line.strip())
+                    except OSError:
+                        pass
+                elif entry.is_dir():
+                    # Regular and namespace packages, as find_spec would report them
+                    if name.isidentifier():
+                        installed.add(name)
+                elif name.endswith(module_suffixes):
+                    installed.add(name.partition(".")[0])
+    return installed
 
 
 # Import name -> Package name mapping for common discrepancies
@@ -268,12 +561,13 @@ PACKAGE_IMPORT_MAP = {
 }
 
 
-def install_module_with_uv(module_name):
+def install_module_with_uv(module_name, package_name=None):
     """Attempt to install the module using uv add."""
-    package_name = PACKAGE_IMPORT_MAP.get(module_name, module_name)
+    if package_name is None:
+        package_name = PACKAGE_IMPORT_MAP.get(module_name, module_name)
     logger.info(f"Installing module: {module_name} (package: {package_name})")
     try:
-        subprocess.check_call(["uv", "add", package_name])
+        subprocess.check_call(["uv", "add", package_name], stdout=subprocess.DEVNULL)
         logger.success(f"Successfully installed {package_name}")
         return True
     except subprocess.CalledProcessError as e:
@@ -281,21 +575,121 @@ def install_module_with_uv(module_name):
         return False
 
 
-def check_project_has_uv_config():
-    """Check if the project has uv configuration (pyproject.toml with uv settings)."""
-    pyproject_path = "pyproject.toml"
-    if not os.path.exists(pyproject_path):
-        return False
-    
+def can_install_package(package_name):
+    """Check whether uv can resolve and install a package, without changing the project."""
+    result = subprocess.run(
+        ["uv", "pip", "install", "--dry-run", package_name],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return result.returncode == 0
+
+
+def install_modules_with_uv(module_names, package_names):
+    """Install several modules with a single uv add, falling back to one at a time.
+
+    Args:
+        module_names: Import names of the missing modules.
+        package_names: The package providing each module, in the same order.
+
+    Returns:
+        A (modules_installed, modules_failed) tuple.
+    """
+    if not module_names:
+        return 0, 0
+
+    logger.info(f"Installing packages: {', '.join(package_names)}")
+    try:
+        # One uv add resolves, locks and installs every package together
+        subprocess.check_call(["uv", "add", *package_names], stdout=subprocess.DEVNULL)
+        logger.success(f"Successfully installed {', '.join(package_names)}")
+        return len(module_names), 0
+    except subprocess.CalledProcessError:
+        logger.warning("Batch install failed. Checking which packages cannot be installed...")
+
+    # Find the failing packages with concurrent dry runs. Running uv add per package
+    # would rewrite the lock file each time and cannot safely run in parallel.
+    with ThreadPoolExecutor() as executor:
+        resolvable = list(executor.map(can_install_package, package_names))
+
+    installable = []
+    for module, package, ok in zip(module_names, package_names, resolvable):
+        if ok:
+            installable.append((module, package))
+        else:
+            logger.error(f"Failed to install package '{package}' for module '{module}'.")
+    modules_failed = len(module_names) - len(installable)
+    if not installable:
+        return 0, modules_failed
+
+    installable_packages = [package for _, package in installable]
+    logger.info(f"Installing remaining packages: {', '.join(installable_packages)}")
     try:
-        # Try to read pyproject.toml to check for project configuration
-        with open(pyproject_path, "r", encoding="utf-8") as f:
-            content = f.read()
-            # Simple check for project configuration
-            return "[project]" in content or "[build-system]" in content
+        subprocess.check_call(["uv", "add", *installable_packages], stdout=subprocess.DEVNULL)
+        logger.success(f"Successfully installed {', '.join(installable_packages)}")
+        return len(installable), modules_failed
+    except subprocess.CalledProcessError:
+        logger.warning("Batch install failed again. Installing packages one at a time...")
+
+    # Last resort: add individually so each failure is attributed to its package
+    modules_installed = sum(
+        1 for module, package in installable if install_module_with_uv(module, package)
+    )
+    return modules_installed, len(module_names) - modules_installed
+
+
+@lru_cache(maxsize=1)
+def _load_pyproject(pyproject_path="pyproject.toml"):
+    """Parse pyproject.toml once, returning None if it is missing or unreadable."""
+    try:
+        with open(pyproject_path, "rb") as f:
+            if tomllib is not None:
+                return tomllib.load(f)
+            # Without a TOML parser, fall back to the table headers present in the text
+            content = f.read().decode("utf-8")
+            return {table: {} for table in ("project", "build-system") if f"[{table}]" in content}
+    except FileNotFoundError:
+        return None
     except Exception as e:
         logger.debug(f"Error reading pyproject.toml: {e}")
-        return False
+        return None
+
+
+def normalize_package_name(name):
+    """Normalize a distribution name as described in PEP 503."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def get_declared_dependencies():
+    """Return the normalized names of the dependencies listed in pyproject.toml."""
+    data = _load_pyproject() or {}
+    declared = set()
+    for requirement in data.get("project", {}).get("dependencies", []):
+        # The name is the leading run before any extras, version or marker
+        match = re.match(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)", requirement)
+        if match:
+            declared.add(normalize_package_name(match.group(1)))
+    return declared
+
+
+def check_project_has_uv_config():
+    """Check if the project has uv configuration (pyproject.toml with uv settings)."""
+    data = _load_pyproject()
+    return data is not None and ("project" in data or "build-system" in data)
+
+
+def _has_root_markers(directory):
+    """Check for a 'src' folder or pyproject.toml with a single directory listing."""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name == "src" and entry.is_dir():
+                    return True
+                if entry.name == "pyproject.toml" and entry.is_file():
+                    return True
+    except OSError:
+        pass
+    return False
 
 
 def main():
@@ -313,18 +707,14 @@ def main():
     project_root = os.path.dirname(script_path)
 
     # Check if we are in the correct directory by looking for a 'src' folder or pyproject.toml
-    has_src = os.path.isdir(os.path.join(project_root, "src"))
-    has_pyproject = os.path.isfile(os.path.join(project_root, "pyproject.toml"))
-    
-    if not has_src and not has_pyproject:
+    if not _has_root_markers(project_root):
         logger.warning(
             f"Neither 'src' directory nor 'pyproject.toml' found in the same directory as the script. Attempting to find project root..."
         )
         # Try to find the project root by going up the directory tree
-        current_dir = project_root
+        current_dir = os.path.dirname(project_root)
         while current_dir != os.path.dirname(current_dir):  # Stop at the root directory
-            if (os.path.isdir(os.path.join(current_dir, "src")) or 
-                os.path.isfile(os.path.join(current_dir, "pyproject.toml"))):
+            if _has_root_markers(current_dir):
                 project_root = current_dir
                 logger.info(f"Found project root at: {project_root}")
                 break
@@ -346,7 +736,7 @@ def main():
 
     # Check for pyproject.toml and sync existing dependencies
     pyproject_file = os.path.join(project_root, "pyproject.toml")
-    sync_dependencies(pyproject_file)
+    synced = sync_dependencies(pyproject_file)
 
     # Check for src directory structure
     src_dir = os.path.join(project_root, "src")
@@ -376,43 +766,49 @@ def main():
     modules = find_all_imports(scan_dirs)
     logger.info(f"Modules found in source files: {sorted(modules)}")
 
-    # List of built-in or standard library modules that we skip installing.
-    builtin_exceptions = {
-        "sys", "os", "time", "math", "itertools", "functools", "subprocess", 
-        "threading", "json", "re", "ast", "datetime", "logging", "random",
-        "pathlib", "collections", "typing", "dataclasses", "enum", "abc",
-        "contextlib", "warnings", "copy", "pickle", "tempfile", "shutil",
-        "glob", "fnmatch", "argparse", "configparser", "urllib", "http",
-        "email", "html", "xml", "csv", "sqlite3", "hashlib", "hmac",
-        "secrets", "uuid", "base64", "binascii", "struct", "io", "gzip",
-        "zipfile", "tarfile", "platform", "socket", "ssl", "ftplib",
-        "unittest", "doctest", "pdb", "trace", "traceback", "inspect",
-        "dis", "gc", "weakref", "ctypes", "multiprocessing", "concurrent",
-        "queue", "threading", "asyncio", "signal", "errno", "stat"
-    }
-
-    # Process each module, checking if it's installed and attempting installation if not.
-    modules_installed = 0
-    modules_failed = 0
-    
-    for module in sorted(mod for mod in modules if mod not in builtin_exceptions):
-        if not is_installed(module):
+    # Standard library modules are never installed. sys.stdlib_module_names is
+    # exact for the running interpreter (3.10+); older versions use a fixed list.
+    try:
+        builtin_exceptions = sys.stdlib_module_names | {"__future__"}
+    except AttributeError:
+        builtin_exceptions = {
+            "sys", "os", "time", "math", "itertools", "functools", "subprocess",
+            "threading", "json", "re", "ast", "datetime", "logging", "random",
+            "pathlib", "collections", "typing", "dataclasses", "enum", "abc",
+            "contextlib", "warnings", "copy", "pickle", "tempfile", "shutil",
+            "glob", "fnmatch", "argparse", "configparser", "urllib", "http",
+            "email", "html", "xml", "csv", "sqlite3", "hashlib", "hmac",
+            "secrets", "uuid", "base64", "binascii", "struct", "io", "gzip",
+            "zipfile", "tarfile", "platform", "socket", "ssl", "ftplib",
+            "unittest", "doctest", "pdb", "trace", "traceback", "inspect",
+            "dis", "gc", "weakref", "ctypes", "multiprocessing", "concurrent",
+            "queue", "threading", "asyncio", "signal", "errno", "stat",
+            "__future__",
+        }
+
+    # After a successful uv sync every dependency declared in pyproject.toml is
+    # installed, so only undeclared modules need checking against the environment
+    declared = get_declared_dependencies() if synced else set()
+
+    # Work out once which modules are missing and which packages provide them
+    candidates = sorted(modules - builtin_exceptions)
+    installed_modules = None
+    missing = []
+    for module in candidates:
+        if normalize_package_name(PACKAGE_IMPORT_MAP.get(module, module)) in declared:
+            logger.info(f"Module '{module}' is declared in pyproject.toml.")
+            continue
+        if installed_modules is None:
+            installed_modules = get_installed_modules()
+        if module not in installed_modules:
             logger.warning(f"Module '{module}' is not installed.")
-            if install_module_with_uv(module):
-                modules_installed += 1
-            else:
-                modules_failed += 1
+            missing.append(module)
         else:
             logger.info(f"Module '{module}' is already installed.")
+    pkgs = [PACKAGE_IMPORT_MAP.get(module, module) for module in missing]
 
-    # Final sync to ensure lock file is up to date
-    if modules_installed > 0:
-        logger.info("Running final sync to update lock file...")
-        try:
-            subprocess.check_call(["uv", "sync"])
-            logger.success("Lock file updated successfully!")
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Error updating lock file: {e}")
+    # Install all missing modules together; uv add also updates the lock file
+    modules_installed, modules_failed = install_modules_with_uv(missing, pkgs)
 
     # Summary
     logger.success("Dependency installation complete!")